@@ -1,26 +1,65 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 import os
+import asyncio
+import inspect
+import hashlib
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+import msgspec
+from typing import List, Optional, Dict, Any, Awaitable, Callable, Tuple
 import uuid
 from datetime import datetime
 from enum import Enum
+import orjson
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Catalog seed data, one JSON file per collection
+SEED_DIR = ROOT_DIR / 'seed'
+SEED_COLLECTIONS = ["skills", "courses", "projects", "roles", "roadmap_levels", "industry_insights"]
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=500,
+    minPoolSize=20,
+    serverSelectionTimeoutMS=2000,
+    connectTimeoutMS=2000,
+    socketTimeoutMS=5000,
+    compressors="zstd",
+)
 db = client[os.environ['DB_NAME']]
 
+# Redis cache for the read-only catalog endpoints (disabled when REDIS_URL is unset)
+redis_url = os.environ.get('REDIS_URL')
+cache = Redis.from_url(redis_url) if redis_url else None
+CACHE_PREFIX = "iot_roadmap:"
+CACHE_TTL_SECONDS = int(os.environ.get('CACHE_TTL_SECONDS', '3600'))
+
+# Short-lived in-process front for the cache as (body, ETag, expiry); Redis stays authoritative,
+# and the TTL bounds how long another worker can serve a response after a reseed
+MEMORY_CACHE_TTL_SECONDS = float(os.environ.get('MEMORY_CACHE_TTL_SECONDS', '30'))
+memory_cache: Dict[str, Tuple[bytes, str, float]] = {}
+
 # Create the main app without a prefix
-app = FastAPI(title="IoT Career Roadmap API", description="API for IoT Professional Development Platform")
+app = FastAPI(
+    title="IoT Career Roadmap API",
+    description="API for IoT Professional Development Platform",
+    default_response_class=ORJSONResponse,
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -41,16 +80,18 @@ class SpecializationArea(str, Enum):
     AGRICULTURE_IOT = "agriculture_iot"
 
 # Data Models
-class Skill(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+_uuid4 = uuid.uuid4
+
+class Skill(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     name: str
     description: str
     category: str  # technical, soft, business
     difficulty_level: DifficultyLevel
     estimated_time_hours: int
 
-class Course(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Course(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     title: str
     description: str
     provider: str
@@ -61,8 +102,8 @@ class Course(BaseModel):
     skills_covered: List[str] = []
     prerequisites: List[str] = []
 
-class Project(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Project(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     title: str
     description: str
     difficulty_level: DifficultyLevel
@@ -73,8 +114,8 @@ class Project(BaseModel):
     detailed_steps: List[str] = []
     expected_outcomes: List[str] = []
 
-class Role(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Role(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     title: str
     description: str
     level: DifficultyLevel
@@ -84,8 +125,8 @@ class Role(BaseModel):
     industry_demand: str  # high, medium, low
     growth_potential: str
 
-class RoadmapLevel(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class RoadmapLevel(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     level_number: int
     title: str
     description: str
@@ -98,8 +139,8 @@ class RoadmapLevel(BaseModel):
     specialization_paths: List[SpecializationArea] = []
     milestone_achievements: List[str] = []
 
-class IndustryInsight(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class IndustryInsight(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(default_factory=lambda: _uuid4().hex)
     specialization: SpecializationArea
     market_size: str
     growth_rate: str
@@ -109,314 +150,224 @@ class IndustryInsight(BaseModel):
     entry_barriers: str
     avg_salary: str
 
+# Projection that keeps Mongo's ObjectId out of every API payload
+EXCLUDE_ID = {"_id": 0}
+
+# JSON helpers
+def _json_default(obj):
+    """Fallback for types the JSON encoders can't serialize natively (e.g. ObjectId)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return str(obj)
+
+_json_encoder = msgspec.json.Encoder(enc_hook=_json_default)
+
+def _dumps(data: Any) -> bytes:
+    return _json_encoder.encode(data)
+
+# Cache helpers
+def cache_key(name: str, **params: Any) -> str:
+    """Build a cache key from the endpoint name and its query parameters"""
+    query = "&".join(f"{k}={v.value if isinstance(v, Enum) else v}" for k, v in params.items() if v is not None)
+    return f"{CACHE_PREFIX}{name}:{query}"
+
+def remember(key: str, body: bytes) -> Tuple[bytes, str, float]:
+    """Store a serialized response in the in-process cache along with its ETag"""
+    # Weak, because GZipMiddleware sends the same validator for the gzip and identity representations
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    entry = (body, etag, time.monotonic() + MEMORY_CACHE_TTL_SECONDS)
+    memory_cache[key] = entry
+    return entry
+
+async def store(key: str, ttl: int, body: bytes) -> Tuple[bytes, str, float]:
+    """Write a serialized response to Redis (when configured) and the in-process front"""
+    if cache is not None:
+        try:
+            await cache.setex(key, ttl, body)
+        except RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+    return remember(key, body)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match list, as GET requires (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in {c.removeprefix("W/") for c in candidates}
+
+def cached_response(entry: Tuple[bytes, str, float], if_none_match: Optional[str]) -> Response:
+    body, etag, _ = entry
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+async def cached(
+    key: str, ttl: int, loader: Callable[[], Awaitable[Any]], if_none_match: Optional[str] = None
+) -> Response:
+    """Serve pre-serialized JSON from memory or Redis, falling back to loader() on a miss"""
+    entry = memory_cache.get(key)
+    if entry is not None and entry[2] > time.monotonic():
+        return cached_response(entry, if_none_match)
+
+    if cache is not None:
+        try:
+            body = await cache.get(key)
+            if body is not None:
+                return cached_response(remember(key, body), if_none_match)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+
+    return cached_response(await store(key, ttl, _dumps(await loader())), if_none_match)
+
+async def invalidate_cache():
+    """Drop every cached catalog response in the app namespace"""
+    memory_cache.clear()
+    if cache is None:
+        return
+    try:
+        keys = [key async for key in cache.scan_iter(match=f"{CACHE_PREFIX}*")]
+        if keys:
+            await cache.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed: {e}")
+
+# Filterable catalog endpoints: (path, collection, model, query param, document field, allowed values, summary)
+CATALOG_ENDPOINTS = [
+    ("/skills", "skills", Skill, "difficulty", "difficulty_level", DifficultyLevel,
+     "Get all skills, optionally filtered by difficulty level"),
+    ("/courses", "courses", Course, "difficulty", "difficulty_level", DifficultyLevel,
+     "Get all courses, optionally filtered by difficulty level"),
+    ("/projects", "projects", Project, "difficulty", "difficulty_level", DifficultyLevel,
+     "Get all projects, optionally filtered by difficulty level"),
+    ("/roles", "roles", Role, "level", "level", DifficultyLevel,
+     "Get all roles, optionally filtered by level"),
+    ("/industry-insights", "industry_insights", IndustryInsight, "specialization", "specialization",
+     SpecializationArea, "Get industry insights, optionally filtered by specialization"),
+]
+
+async def warm_catalog_cache():
+    """Load the static catalog once and pre-serialize every endpoint/filter combination"""
+    await store(cache_key("roadmap"), CACHE_TTL_SECONDS, _dumps(await load_roadmap()))
+    for _, collection, model, param, field, values, _ in CATALOG_ENDPOINTS:
+        items = await load_collection(collection, model)
+        await store(cache_key(collection), CACHE_TTL_SECONDS, _dumps(items))
+        for value in values:
+            matching = [item for item in items if getattr(item, field) == value]
+            await store(cache_key(collection, **{param: value}), CACHE_TTL_SECONDS, _dumps(matching))
+
+async def load_collection(collection: str, model: type, query: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """Read a catalog collection and convert it to its model so responses carry the model defaults"""
+    docs = await db[collection].find(query or {}, EXCLUDE_ID).batch_size(1000).to_list(1000)
+    return msgspec.convert(docs, List[model])
+
+async def load_roadmap() -> List[RoadmapLevel]:
+    roadmap_data = await db.roadmap_levels.find({}, EXCLUDE_ID).sort("level_number", 1).batch_size(100).to_list(100)
+    if not roadmap_data:
+        # Initialize with sample data if empty
+        await initialize_roadmap_data()
+        roadmap_data = await db.roadmap_levels.find({}, EXCLUDE_ID).sort("level_number", 1).batch_size(100).to_list(100)
+    return msgspec.convert(roadmap_data, List[RoadmapLevel])
+
 # API Endpoints
 @api_router.get("/")
 async def root():
     return {"message": "IoT Career Roadmap API", "version": "1.0"}
 
-@api_router.get("/roadmap", response_model=List[RoadmapLevel])
-async def get_roadmap():
+@api_router.get("/roadmap", response_model=None)
+async def get_roadmap(request: Request):
     """Get the complete IoT career roadmap"""
-    roadmap_data = await db.roadmap_levels.find().sort("level_number", 1).to_list(100)
-    if not roadmap_data:
-        # Initialize with sample data if empty
-        await initialize_roadmap_data()
-        roadmap_data = await db.roadmap_levels.find().sort("level_number", 1).to_list(100)
-    return [RoadmapLevel(**level) for level in roadmap_data]
-
-@api_router.get("/skills", response_model=List[Skill])
-async def get_skills(difficulty: Optional[DifficultyLevel] = None):
-    """Get all skills, optionally filtered by difficulty level"""
-    query = {"difficulty_level": difficulty} if difficulty else {}
-    skills_data = await db.skills.find(query).to_list(1000)
-    return [Skill(**skill) for skill in skills_data]
-
-@api_router.get("/courses", response_model=List[Course])
-async def get_courses(difficulty: Optional[DifficultyLevel] = None):
-    """Get all courses, optionally filtered by difficulty level"""
-    query = {"difficulty_level": difficulty} if difficulty else {}
-    courses_data = await db.courses.find(query).to_list(1000)
-    return [Course(**course) for course in courses_data]
-
-@api_router.get("/projects", response_model=List[Project])
-async def get_projects(difficulty: Optional[DifficultyLevel] = None):
-    """Get all projects, optionally filtered by difficulty level"""
-    query = {"difficulty_level": difficulty} if difficulty else {}
-    projects_data = await db.projects.find(query).to_list(1000)
-    return [Project(**project) for project in projects_data]
-
-@api_router.get("/roles", response_model=List[Role])
-async def get_roles(level: Optional[DifficultyLevel] = None):
-    """Get all roles, optionally filtered by level"""
-    query = {"level": level} if level else {}
-    roles_data = await db.roles.find(query).to_list(1000)
-    return [Role(**role) for role in roles_data]
-
-@api_router.get("/industry-insights", response_model=List[IndustryInsight])
-async def get_industry_insights(specialization: Optional[SpecializationArea] = None):
-    """Get industry insights, optionally filtered by specialization"""
-    query = {"specialization": specialization} if specialization else {}
-    insights_data = await db.industry_insights.find(query).to_list(100)
-    return [IndustryInsight(**insight) for insight in insights_data]
-
-@api_router.get("/roadmap/level/{level_id}")
-async def get_level_details(level_id: str):
+    return await cached(
+        cache_key("roadmap"), CACHE_TTL_SECONDS, load_roadmap, request.headers.get("if-none-match")
+    )
+
+@api_router.get("/bundle", response_model=None)
+async def get_bundle(request: Request):
+    """Get every catalog collection and the roadmap in a single document"""
+    async def load():
+        # Load the roadmap first so an empty database is seeded before the collections are read
+        roadmap_data = await load_roadmap()
+        collections = [collection for _, collection, *_ in CATALOG_ENDPOINTS]
+        results = await asyncio.gather(
+            *(load_collection(collection, model) for _, collection, model, *_ in CATALOG_ENDPOINTS)
+        )
+        return {**dict(zip(collections, results)), "roadmap": roadmap_data}
+    return await cached(cache_key("bundle"), CACHE_TTL_SECONDS, load, request.headers.get("if-none-match"))
+
+def make_list_endpoint(collection: str, model: type, param: str, field: str, values: type, summary: str):
+    """Build a cached GET handler for a catalog collection with an optional enum filter"""
+    filter_values = {value: value.value for value in values}
+
+    async def handler(request: Request, **params):
+        value = params.get(param)
+        query = {field: filter_values[value]} if value else {}
+        async def load():
+            return await load_collection(collection, model, query)
+        return await cached(
+            cache_key(collection, **{param: value}), CACHE_TTL_SECONDS, load, request.headers.get("if-none-match")
+        )
+
+    # FastAPI reads the query parameter name and type from the signature
+    handler.__name__ = f"get_{collection}"
+    handler.__doc__ = summary
+    handler.__signature__ = inspect.Signature([
+        inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request),
+        inspect.Parameter(param, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[values]),
+    ])
+    return handler
+
+for path, collection, model, param, field, values, summary in CATALOG_ENDPOINTS:
+    api_router.add_api_route(
+        path, make_list_endpoint(collection, model, param, field, values, summary), methods=["GET"], response_model=None
+    )
+
+@api_router.get("/roadmap/level/{level_id}", response_model=None)
+async def get_level_details(level_id: str, request: Request):
     """Get detailed information for a specific roadmap level"""
-    level_data = await db.roadmap_levels.find_one({"id": level_id})
-    if not level_data:
-        raise HTTPException(status_code=404, detail="Level not found")
-    
-    # Get associated skills, courses, projects, and roles
-    skills = await db.skills.find({"id": {"$in": level_data.get("skills_to_develop", [])}}).to_list(100)
-    courses = await db.courses.find({"id": {"$in": level_data.get("recommended_courses", [])}}).to_list(100)
-    projects = await db.projects.find({"id": {"$in": level_data.get("projects_to_complete", [])}}).to_list(100)
-    roles = await db.roles.find({"id": {"$in": level_data.get("roles_available", [])}}).to_list(100)
-    
-    return {
-        "level": RoadmapLevel(**level_data),
-        "skills": [Skill(**skill) for skill in skills],
-        "courses": [Course(**course) for course in courses],
-        "projects": [Project(**project) for project in projects],
-        "roles": [Role(**role) for role in roles]
-    }
+    # Level details are as static as the catalog, so the encoded document is cached per level
+    async def load():
+        # Resolve the level and its related skills, courses, projects and roles server-side in one round trip
+        pipeline = [
+            {"$match": {"id": level_id}},
+            {"$limit": 1},
+            {"$lookup": {"from": "skills", "localField": "skills_to_develop", "foreignField": "id", "as": "skills"}},
+            {"$lookup": {"from": "courses", "localField": "recommended_courses", "foreignField": "id", "as": "courses"}},
+            {"$lookup": {"from": "projects", "localField": "projects_to_complete", "foreignField": "id", "as": "projects"}},
+            {"$lookup": {"from": "roles", "localField": "roles_available", "foreignField": "id", "as": "roles"}},
+            {"$project": {"_id": 0, "skills._id": 0, "courses._id": 0, "projects._id": 0, "roles._id": 0}},
+        ]
+        results = await db.roadmap_levels.aggregate(pipeline).to_list(1)
+        if not results:
+            raise HTTPException(status_code=404, detail="Level not found")
+        
+        level_data = results[0]
+        skills = level_data.pop("skills")
+        courses = level_data.pop("courses")
+        projects = level_data.pop("projects")
+        roles = level_data.pop("roles")
+        
+        return {
+            "level": msgspec.convert(level_data, RoadmapLevel),
+            "skills": msgspec.convert(skills, List[Skill]),
+            "courses": msgspec.convert(courses, List[Course]),
+            "projects": msgspec.convert(projects, List[Project]),
+            "roles": msgspec.convert(roles, List[Role])
+        }
+    return await cached(
+        cache_key("level", id=level_id), CACHE_TTL_SECONDS, load, request.headers.get("if-none-match")
+    )
 
 async def initialize_roadmap_data():
     """Initialize the database with comprehensive IoT career roadmap data"""
+    seed = {name: orjson.loads((SEED_DIR / f"{name}.json").read_bytes()) for name in SEED_COLLECTIONS}
     
-    # Skills Data
-    skills_data = [
-        {
-            "id": "skill_1", "name": "Electronics Fundamentals", "description": "Understanding of basic electronic components, circuits, and principles",
-            "category": "technical", "difficulty_level": "beginner", "estimated_time_hours": 40
-        },
-        {
-            "id": "skill_2", "name": "Programming (Python/C++)", "description": "Proficiency in programming languages commonly used in IoT",
-            "category": "technical", "difficulty_level": "beginner", "estimated_time_hours": 80
-        },
-        {
-            "id": "skill_3", "name": "Networking Protocols", "description": "Understanding of TCP/IP, HTTP, MQTT, CoAP and other IoT protocols",
-            "category": "technical", "difficulty_level": "intermediate", "estimated_time_hours": 60
-        },
-        {
-            "id": "skill_4", "name": "Cloud Platforms", "description": "Experience with AWS IoT, Azure IoT, Google Cloud IoT",
-            "category": "technical", "difficulty_level": "intermediate", "estimated_time_hours": 70
-        },
-        {
-            "id": "skill_5", "name": "Data Analytics", "description": "Ability to analyze and visualize IoT data using tools like Python, R, or Tableau",
-            "category": "technical", "difficulty_level": "intermediate", "estimated_time_hours": 90
-        },
-        {
-            "id": "skill_6", "name": "Security & Privacy", "description": "Understanding of IoT security challenges and implementation of security measures",
-            "category": "technical", "difficulty_level": "advanced", "estimated_time_hours": 100
-        },
-        {
-            "id": "skill_7", "name": "Machine Learning", "description": "Implementing ML algorithms for IoT data processing and edge computing",
-            "category": "technical", "difficulty_level": "advanced", "estimated_time_hours": 120
-        },
-        {
-            "id": "skill_8", "name": "System Architecture", "description": "Designing scalable and robust IoT system architectures",
-            "category": "technical", "difficulty_level": "expert", "estimated_time_hours": 150
-        },
-        {
-            "id": "skill_9", "name": "Project Management", "description": "Leading IoT projects from conception to deployment",
-            "category": "business", "difficulty_level": "intermediate", "estimated_time_hours": 50
-        },
-        {
-            "id": "skill_10", "name": "Communication Skills", "description": "Effectively communicating technical concepts to stakeholders",
-            "category": "soft", "difficulty_level": "beginner", "estimated_time_hours": 30
-        }
-    ]
-    
-    # Courses Data
-    courses_data = [
-        {
-            "id": "course_1", "title": "Introduction to IoT", "description": "Comprehensive introduction to Internet of Things concepts and applications",
-            "provider": "Coursera", "duration_weeks": 4, "difficulty_level": "beginner", "cost": "Free",
-            "skills_covered": ["skill_1", "skill_10"], "prerequisites": []
-        },
-        {
-            "id": "course_2", "title": "IoT Programming with Python", "description": "Learn to program IoT devices using Python",
-            "provider": "Udemy", "duration_weeks": 6, "difficulty_level": "beginner", "cost": "$49",
-            "skills_covered": ["skill_2"], "prerequisites": ["course_1"]
-        },
-        {
-            "id": "course_3", "title": "IoT Networking and Protocols", "description": "Deep dive into IoT communication protocols and networking",
-            "provider": "edX", "duration_weeks": 8, "difficulty_level": "intermediate", "cost": "$99",
-            "skills_covered": ["skill_3"], "prerequisites": ["course_1", "course_2"]
-        },
-        {
-            "id": "course_4", "title": "Cloud Computing for IoT", "description": "Implementing IoT solutions using cloud platforms",
-            "provider": "AWS Training", "duration_weeks": 6, "difficulty_level": "intermediate", "cost": "$199",
-            "skills_covered": ["skill_4"], "prerequisites": ["course_3"]
-        },
-        {
-            "id": "course_5", "title": "IoT Data Analytics", "description": "Analyzing and visualizing IoT data for insights",
-            "provider": "Coursera", "duration_weeks": 8, "difficulty_level": "intermediate", "cost": "$79",
-            "skills_covered": ["skill_5"], "prerequisites": ["course_2"]
-        },
-        {
-            "id": "course_6", "title": "IoT Security", "description": "Comprehensive IoT security and privacy protection",
-            "provider": "Cybrary", "duration_weeks": 10, "difficulty_level": "advanced", "cost": "$299",
-            "skills_covered": ["skill_6"], "prerequisites": ["course_3", "course_4"]
-        },
-        {
-            "id": "course_7", "title": "AI/ML for IoT", "description": "Implementing machine learning in IoT systems",
-            "provider": "Stanford Online", "duration_weeks": 12, "difficulty_level": "advanced", "cost": "$499",
-            "skills_covered": ["skill_7"], "prerequisites": ["course_5"]
-        },
-        {
-            "id": "course_8", "title": "IoT System Architecture", "description": "Designing enterprise-grade IoT architectures",
-            "provider": "MIT Professional Education", "duration_weeks": 8, "difficulty_level": "expert", "cost": "$799",
-            "skills_covered": ["skill_8"], "prerequisites": ["course_6", "course_7"]
-        }
-    ]
-    
-    # Projects Data
-    projects_data = [
-        {
-            "id": "project_1", "title": "Smart Home Temperature Monitor", "description": "Build a basic temperature monitoring system using Arduino",
-            "difficulty_level": "beginner", "estimated_time_weeks": 2, "technologies_used": ["Arduino", "Temperature Sensor", "WiFi"],
-            "skills_practiced": ["skill_1", "skill_2"], "industry_relevance": ["consumer_iot"],
-            "detailed_steps": ["Set up Arduino", "Connect temperature sensor", "Program data reading", "Display on LCD"],
-            "expected_outcomes": ["Working temperature monitor", "Basic IoT understanding", "Arduino programming experience"]
-        },
-        {
-            "id": "project_2", "title": "IoT Weather Station", "description": "Create a comprehensive weather monitoring system with cloud connectivity",
-            "difficulty_level": "intermediate", "estimated_time_weeks": 4, "technologies_used": ["Raspberry Pi", "Multiple Sensors", "MQTT", "Cloud"],
-            "skills_practiced": ["skill_2", "skill_3", "skill_4"], "industry_relevance": ["smart_cities", "agriculture_iot"],
-            "detailed_steps": ["Setup Raspberry Pi", "Connect multiple sensors", "Implement MQTT communication", "Store data in cloud"],
-            "expected_outcomes": ["Complete weather station", "Cloud integration experience", "Protocol implementation"]
-        },
-        {
-            "id": "project_3", "title": "Industrial Equipment Monitor", "description": "Develop a system to monitor industrial equipment health and performance",
-            "difficulty_level": "advanced", "estimated_time_weeks": 8, "technologies_used": ["Industrial Sensors", "Edge Computing", "ML", "Dashboard"],
-            "skills_practiced": ["skill_5", "skill_6", "skill_7"], "industry_relevance": ["industrial_iot"],
-            "detailed_steps": ["Install industrial sensors", "Implement edge computing", "Develop ML algorithms", "Create monitoring dashboard"],
-            "expected_outcomes": ["Predictive maintenance system", "ML implementation", "Industrial IoT experience"]
-        },
-        {
-            "id": "project_4", "title": "Smart City Traffic Management", "description": "Design and implement a traffic optimization system using IoT",
-            "difficulty_level": "expert", "estimated_time_weeks": 12, "technologies_used": ["Traffic Sensors", "AI", "Real-time Analytics", "Mobile App"],
-            "skills_practiced": ["skill_7", "skill_8", "skill_9"], "industry_relevance": ["smart_cities"],
-            "detailed_steps": ["Deploy traffic sensors", "Implement AI algorithms", "Build real-time analytics", "Develop mobile interface"],
-            "expected_outcomes": ["Complete traffic system", "AI implementation", "System architecture design"]
-        }
-    ]
-    
-    # Roles Data
-    roles_data = [
-        {
-            "id": "role_1", "title": "IoT Developer", "description": "Entry-level position developing IoT applications and prototypes",
-            "level": "beginner", "salary_range": "$50,000 - $70,000", "industry_demand": "high", "growth_potential": "excellent",
-            "responsibilities": ["Develop IoT prototypes", "Program embedded devices", "Basic testing and debugging"],
-            "required_skills": ["skill_1", "skill_2", "skill_10"]
-        },
-        {
-            "id": "role_2", "title": "IoT Solutions Engineer", "description": "Design and implement IoT solutions for specific business needs",
-            "level": "intermediate", "salary_range": "$70,000 - $95,000", "industry_demand": "high", "growth_potential": "excellent",
-            "responsibilities": ["Design IoT solutions", "Integrate cloud platforms", "Work with clients"],
-            "required_skills": ["skill_2", "skill_3", "skill_4", "skill_9"]
-        },
-        {
-            "id": "role_3", "title": "IoT Security Specialist", "description": "Focus on securing IoT systems and data protection",
-            "level": "advanced", "salary_range": "$90,000 - $120,000", "industry_demand": "very high", "growth_potential": "outstanding",
-            "responsibilities": ["Implement security measures", "Conduct security audits", "Develop security protocols"],
-            "required_skills": ["skill_6", "skill_3", "skill_8"]
-        },
-        {
-            "id": "role_4", "title": "IoT Architect", "description": "Senior role designing enterprise-scale IoT architectures",
-            "level": "expert", "salary_range": "$120,000 - $180,000", "industry_demand": "very high", "growth_potential": "outstanding",
-            "responsibilities": ["Design system architectures", "Lead technical teams", "Strategic planning"],
-            "required_skills": ["skill_8", "skill_9", "skill_6", "skill_7"]
-        }
-    ]
-    
-    # Roadmap Levels Data
-    roadmap_data = [
-        {
-            "id": "level_1", "level_number": 1, "title": "IoT Foundation", "description": "Build fundamental knowledge and skills in IoT",
-            "difficulty_level": "beginner", "estimated_duration_months": 3,
-            "skills_to_develop": ["skill_1", "skill_2", "skill_10"],
-            "recommended_courses": ["course_1", "course_2"],
-            "projects_to_complete": ["project_1"],
-            "roles_available": ["role_1"],
-            "specialization_paths": ["consumer_iot"],
-            "milestone_achievements": ["Completed first IoT project", "Basic programming skills", "Understanding of IoT ecosystem"]
-        },
-        {
-            "id": "level_2", "level_number": 2, "title": "IoT Development", "description": "Develop intermediate skills and start specializing",
-            "difficulty_level": "intermediate", "estimated_duration_months": 6,
-            "skills_to_develop": ["skill_3", "skill_4", "skill_5", "skill_9"],
-            "recommended_courses": ["course_3", "course_4", "course_5"],
-            "projects_to_complete": ["project_2"],
-            "roles_available": ["role_2"],
-            "specialization_paths": ["smart_cities", "agriculture_iot", "healthcare_iot"],
-            "milestone_achievements": ["Cloud platform integration", "Data analytics capabilities", "Protocol implementation"]
-        },
-        {
-            "id": "level_3", "level_number": 3, "title": "IoT Specialization", "description": "Advanced skills with focus on security and AI",
-            "difficulty_level": "advanced", "estimated_duration_months": 9,
-            "skills_to_develop": ["skill_6", "skill_7"],
-            "recommended_courses": ["course_6", "course_7"],
-            "projects_to_complete": ["project_3"],
-            "roles_available": ["role_3"],
-            "specialization_paths": ["industrial_iot", "automotive_iot"],
-            "milestone_achievements": ["Security implementation", "ML integration", "Advanced project completion"]
-        },
-        {
-            "id": "level_4", "level_number": 4, "title": "IoT Leadership", "description": "Expert-level skills and leadership capabilities",
-            "difficulty_level": "expert", "estimated_duration_months": 12,
-            "skills_to_develop": ["skill_8"],
-            "recommended_courses": ["course_8"],
-            "projects_to_complete": ["project_4"],
-            "roles_available": ["role_4"],
-            "specialization_paths": ["industrial_iot", "smart_cities", "healthcare_iot"],
-            "milestone_achievements": ["System architecture design", "Team leadership", "Enterprise-scale deployment"]
-        }
-    ]
-    
-    # Industry Insights Data
-    industry_data = [
-        {
-            "id": "insight_1", "specialization": "industrial_iot", "market_size": "$263.4 billion by 2027",
-            "growth_rate": "16.7% CAGR", "avg_salary": "$95,000 - $140,000",
-            "key_trends": ["Predictive maintenance", "Digital twins", "Edge computing", "5G integration"],
-            "major_companies": ["GE", "Siemens", "Honeywell", "Schneider Electric"],
-            "future_outlook": "Massive growth expected with Industry 4.0 adoption",
-            "entry_barriers": "Requires understanding of industrial processes and safety standards"
-        },
-        {
-            "id": "insight_2", "specialization": "smart_cities", "market_size": "$2.5 trillion by 2025",
-            "growth_rate": "18.4% CAGR", "avg_salary": "$80,000 - $120,000",
-            "key_trends": ["Smart traffic management", "Environmental monitoring", "Energy optimization", "Citizen services"],
-            "major_companies": ["IBM", "Cisco", "Microsoft", "Oracle"],
-            "future_outlook": "Huge opportunities as cities digitize infrastructure",
-            "entry_barriers": "Understanding of urban planning and government processes helpful"
-        },
-        {
-            "id": "insight_3", "specialization": "healthcare_iot", "market_size": "$659.8 billion by 2025",
-            "growth_rate": "25.9% CAGR", "avg_salary": "$85,000 - $130,000",
-            "key_trends": ["Remote patient monitoring", "Wearable devices", "Telemedicine", "AI diagnostics"],
-            "major_companies": ["Philips", "GE Healthcare", "Medtronic", "Abbott"],
-            "future_outlook": "Accelerated growth post-pandemic, regulatory support",
-            "entry_barriers": "Requires knowledge of healthcare regulations and patient privacy"
-        }
-    ]
-    
-    # Insert all data
-    await db.skills.delete_many({})
-    await db.courses.delete_many({})
-    await db.projects.delete_many({})
-    await db.roles.delete_many({})
-    await db.roadmap_levels.delete_many({})
-    await db.industry_insights.delete_many({})
-    
-    await db.skills.insert_many(skills_data)
-    await db.courses.insert_many(courses_data)
-    await db.projects.insert_many(projects_data)
-    await db.roles.insert_many(roles_data)
-    await db.roadmap_levels.insert_many(roadmap_data)
-    await db.industry_insights.insert_many(industry_data)
+    # Insert all data, overlapping the independent per-collection writes
+    await asyncio.gather(*(db[name].delete_many({}) for name in seed))
+    await asyncio.gather(*(db[name].insert_many(docs, ordered=False) for name, docs in seed.items()))
+    await invalidate_cache()
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -429,13 +380,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+# Configure logging; records are queued on the event loop thread and written to stderr by a listener thread
+log_queue = queue.Queue(-1)
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, log_handler)
+queue_handler = QueueHandler(log_queue)
+logging.root.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_log_listener():
+    # Attached here rather than at import (or via basicConfig, which would give it its own format)
+    # so the queue only receives records while the listener is draining it
+    log_listener.start()
+    logging.root.addHandler(queue_handler)
+
+@app.on_event("startup")
+async def create_indexes():
+    try:
+        await db.skills.create_index("id", unique=True)
+        await db.skills.create_index("difficulty_level")
+        await db.courses.create_index("id", unique=True)
+        await db.courses.create_index("difficulty_level")
+        await db.projects.create_index("id", unique=True)
+        await db.projects.create_index("difficulty_level")
+        await db.roles.create_index("id", unique=True)
+        await db.roles.create_index("level")
+        await db.roadmap_levels.create_index("id", unique=True)
+        await db.roadmap_levels.create_index("level_number")
+        await db.industry_insights.create_index("id", unique=True)
+        await db.industry_insights.create_index("specialization")
+    except PyMongoError as e:
+        logger.warning(f"Index creation failed, continuing without it: {e}")
+
+@app.on_event("startup")
+async def load_catalog():
+    # Boot even when Mongo is unreachable; cached() loads each response lazily on first request
+    try:
+        await warm_catalog_cache()
+    except PyMongoError as e:
+        logger.warning(f"Catalog cache warm-up failed, responses will load on demand: {e}")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
+    if cache is not None:
+        await cache.aclose()
+
+@app.on_event("shutdown")
+async def stop_log_listener():
+    logging.root.removeHandler(queue_handler)
+    log_listener.stop()
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Pass the app object; an import string would make uvicorn import this file a second time
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop="uvloop", http="httptools")
@@ -1,249 +1,306 @@
-import requests
-import unittest
+import fastjsonschema
+import ijson
+import pytest
+import pytest_asyncio
+import orjson
+import os
 import sys
-import json
-
-# Use the public endpoint from frontend/.env
-BACKEND_URL = "https://d369f806-187f-4f1d-afc8-a5a03877c618.preview.emergentagent.com"
-API_URL = f"{BACKEND_URL}/api"
-
-class IoTRoadmapAPITest(unittest.TestCase):
-    """Test suite for IoT Career Roadmap API endpoints"""
-    
-    def test_01_root_endpoint(self):
-        """Test the root API endpoint"""
-        print("\n🔍 Testing root API endpoint...")
-        response = requests.get(f"{API_URL}/")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertEqual(data["message"], "IoT Career Roadmap API")
-        print("✅ Root API endpoint test passed")
-    
-    def test_02_get_roadmap(self):
-        """Test the roadmap endpoint"""
-        print("\n🔍 Testing roadmap endpoint...")
-        response = requests.get(f"{API_URL}/roadmap")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertEqual(len(data), 4)  # Should have 4 roadmap levels
-        
-        # Verify roadmap level structure
-        level = data[0]
-        self.assertIn("id", level)
-        self.assertIn("level_number", level)
-        self.assertIn("title", level)
-        self.assertIn("description", level)
-        self.assertIn("difficulty_level", level)
-        self.assertIn("estimated_duration_months", level)
-        self.assertIn("skills_to_develop", level)
-        self.assertIn("recommended_courses", level)
-        self.assertIn("projects_to_complete", level)
-        self.assertIn("roles_available", level)
-        self.assertIn("specialization_paths", level)
-        self.assertIn("milestone_achievements", level)
-        
-        # Verify level ordering
-        self.assertEqual(data[0]["level_number"], 1)
-        self.assertEqual(data[1]["level_number"], 2)
-        self.assertEqual(data[2]["level_number"], 3)
-        self.assertEqual(data[3]["level_number"], 4)
-        
-        # Store level ID for later tests
-        self.level_id = data[0]["id"]
-        print(f"✅ Roadmap endpoint test passed - Found {len(data)} levels")
-    
-    def test_03_get_level_details(self):
-        """Test the level details endpoint"""
-        print("\n🔍 Testing level details endpoint...")
-        # Make sure we have a level ID from previous test
-        if not hasattr(self, 'level_id'):
-            self.test_02_get_roadmap()
-        
-        response = requests.get(f"{API_URL}/roadmap/level/{self.level_id}")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        
-        # Verify level details structure
-        self.assertIn("level", data)
-        self.assertIn("skills", data)
-        self.assertIn("courses", data)
-        self.assertIn("projects", data)
-        self.assertIn("roles", data)
-        
-        # Verify data relationships
-        level = data["level"]
-        skills = data["skills"]
-        courses = data["courses"]
-        projects = data["projects"]
-        roles = data["roles"]
-        
-        # Check that skills in level match skills array
-        skill_ids = [skill["id"] for skill in skills]
-        for skill_id in level["skills_to_develop"]:
-            self.assertIn(skill_id, skill_ids)
-        
-        # Check that courses in level match courses array
-        course_ids = [course["id"] for course in courses]
-        for course_id in level["recommended_courses"]:
-            self.assertIn(course_id, course_ids)
-        
-        print(f"✅ Level details endpoint test passed - Found {len(skills)} skills, {len(courses)} courses, {len(projects)} projects, {len(roles)} roles")
-    
-    def test_04_get_skills(self):
-        """Test the skills endpoint"""
-        print("\n🔍 Testing skills endpoint...")
-        response = requests.get(f"{API_URL}/skills")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreaterEqual(len(data), 10)  # Should have at least 10 skills
-        
-        # Verify skill structure
-        skill = data[0]
-        self.assertIn("id", skill)
-        self.assertIn("name", skill)
-        self.assertIn("description", skill)
-        self.assertIn("category", skill)
-        self.assertIn("difficulty_level", skill)
-        self.assertIn("estimated_time_hours", skill)
-        
-        # Test filtering by difficulty
-        response = requests.get(f"{API_URL}/skills?difficulty=beginner")
-        self.assertEqual(response.status_code, 200)
-        beginner_skills = response.json()
-        self.assertIsInstance(beginner_skills, list)
-        for skill in beginner_skills:
-            self.assertEqual(skill["difficulty_level"], "beginner")
-        
-        print(f"✅ Skills endpoint test passed - Found {len(data)} skills")
-    
-    def test_05_get_courses(self):
-        """Test the courses endpoint"""
-        print("\n🔍 Testing courses endpoint...")
-        response = requests.get(f"{API_URL}/courses")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreaterEqual(len(data), 8)  # Should have at least 8 courses
-        
-        # Verify course structure
-        course = data[0]
-        self.assertIn("id", course)
-        self.assertIn("title", course)
-        self.assertIn("description", course)
-        self.assertIn("provider", course)
-        self.assertIn("duration_weeks", course)
-        self.assertIn("difficulty_level", course)
-        self.assertIn("cost", course)
-        self.assertIn("skills_covered", course)
-        self.assertIn("prerequisites", course)
-        
-        # Test filtering by difficulty
-        response = requests.get(f"{API_URL}/courses?difficulty=advanced")
-        self.assertEqual(response.status_code, 200)
-        advanced_courses = response.json()
-        self.assertIsInstance(advanced_courses, list)
-        for course in advanced_courses:
-            self.assertEqual(course["difficulty_level"], "advanced")
-        
-        print(f"✅ Courses endpoint test passed - Found {len(data)} courses")
-    
-    def test_06_get_projects(self):
-        """Test the projects endpoint"""
-        print("\n🔍 Testing projects endpoint...")
-        response = requests.get(f"{API_URL}/projects")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreaterEqual(len(data), 4)  # Should have at least 4 projects
-        
-        # Verify project structure
-        project = data[0]
-        self.assertIn("id", project)
-        self.assertIn("title", project)
-        self.assertIn("description", project)
-        self.assertIn("difficulty_level", project)
-        self.assertIn("estimated_time_weeks", project)
-        self.assertIn("technologies_used", project)
-        self.assertIn("skills_practiced", project)
-        self.assertIn("industry_relevance", project)
-        self.assertIn("detailed_steps", project)
-        self.assertIn("expected_outcomes", project)
-        
-        # Test filtering by difficulty
-        response = requests.get(f"{API_URL}/projects?difficulty=expert")
-        self.assertEqual(response.status_code, 200)
-        expert_projects = response.json()
-        self.assertIsInstance(expert_projects, list)
-        for project in expert_projects:
-            self.assertEqual(project["difficulty_level"], "expert")
-        
-        print(f"✅ Projects endpoint test passed - Found {len(data)} projects")
-    
-    def test_07_get_roles(self):
-        """Test the roles endpoint"""
-        print("\n🔍 Testing roles endpoint...")
-        response = requests.get(f"{API_URL}/roles")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreaterEqual(len(data), 4)  # Should have at least 4 roles
-        
-        # Verify role structure
-        role = data[0]
-        self.assertIn("id", role)
-        self.assertIn("title", role)
-        self.assertIn("description", role)
-        self.assertIn("level", role)
-        self.assertIn("salary_range", role)
-        self.assertIn("responsibilities", role)
-        self.assertIn("required_skills", role)
-        self.assertIn("industry_demand", role)
-        self.assertIn("growth_potential", role)
-        
-        # Test filtering by level
-        response = requests.get(f"{API_URL}/roles?level=intermediate")
-        self.assertEqual(response.status_code, 200)
-        intermediate_roles = response.json()
-        self.assertIsInstance(intermediate_roles, list)
-        for role in intermediate_roles:
-            self.assertEqual(role["level"], "intermediate")
-        
-        print(f"✅ Roles endpoint test passed - Found {len(data)} roles")
-    
-    def test_08_get_industry_insights(self):
-        """Test the industry insights endpoint"""
-        print("\n🔍 Testing industry insights endpoint...")
-        response = requests.get(f"{API_URL}/industry-insights")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreaterEqual(len(data), 3)  # Should have at least 3 industry insights
-        
-        # Verify industry insight structure
-        insight = data[0]
-        self.assertIn("id", insight)
-        self.assertIn("specialization", insight)
-        self.assertIn("market_size", insight)
-        self.assertIn("growth_rate", insight)
-        self.assertIn("key_trends", insight)
-        self.assertIn("major_companies", insight)
-        self.assertIn("future_outlook", insight)
-        self.assertIn("entry_barriers", insight)
-        self.assertIn("avg_salary", insight)
-        
-        # Test filtering by specialization
-        response = requests.get(f"{API_URL}/industry-insights?specialization=industrial_iot")
-        self.assertEqual(response.status_code, 200)
-        industrial_insights = response.json()
-        self.assertIsInstance(industrial_insights, list)
-        for insight in industrial_insights:
-            self.assertEqual(insight["specialization"], "industrial_iot")
-        
-        print(f"✅ Industry insights endpoint test passed - Found {len(data)} insights")
+from pathlib import Path
+from urllib.parse import urlencode
+
+# Endpoint paths relative to the client's base URL, resolved once at import
+PATHS = {
+    "root": "/api/",
+    "roadmap": "/api/roadmap",
+    "skills": "/api/skills",
+    "courses": "/api/courses",
+    "projects": "/api/projects",
+    "roles": "/api/roles",
+    "insights": "/api/industry-insights",
+    "bundle": "/api/bundle"
+}
+
+# All tests share the session-scoped client from conftest.py, so they must run on the same event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Response schemas, mirroring the backend models
+ROADMAP_LEVEL_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "level_number", "title", "description", "difficulty_level",
+        "estimated_duration_months", "skills_to_develop", "recommended_courses",
+        "projects_to_complete", "roles_available", "specialization_paths",
+        "milestone_achievements"
+    ]
+}
+
+SKILL_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "name", "description", "category", "difficulty_level",
+        "estimated_time_hours"
+    ]
+}
+
+COURSE_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "title", "description", "provider", "duration_weeks", "difficulty_level",
+        "cost", "skills_covered", "prerequisites"
+    ]
+}
+
+PROJECT_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "title", "description", "difficulty_level", "estimated_time_weeks",
+        "technologies_used", "skills_practiced", "industry_relevance",
+        "detailed_steps", "expected_outcomes"
+    ]
+}
+
+ROLE_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "title", "description", "level", "salary_range", "responsibilities",
+        "required_skills", "industry_demand", "growth_potential"
+    ]
+}
+
+INDUSTRY_INSIGHT_SCHEMA = {
+    "type": "object",
+    "required": [
+        "id", "specialization", "market_size", "growth_rate", "key_trends",
+        "major_companies", "future_outlook", "entry_barriers", "avg_salary"
+    ]
+}
+
+LEVEL_DETAILS_SCHEMA = {
+    "type": "object",
+    "required": ["level", "skills", "courses", "projects", "roles"]
+}
+
+# Compiled once so each response is validated in a single pass
+validate_roadmap_level_list = fastjsonschema.compile({"type": "array", "items": ROADMAP_LEVEL_SCHEMA})
+validate_skill_list = fastjsonschema.compile({"type": "array", "items": SKILL_SCHEMA})
+validate_course_list = fastjsonschema.compile({"type": "array", "items": COURSE_SCHEMA})
+validate_project_list = fastjsonschema.compile({"type": "array", "items": PROJECT_SCHEMA})
+validate_role_list = fastjsonschema.compile({"type": "array", "items": ROLE_SCHEMA})
+validate_industry_insight_list = fastjsonschema.compile({"type": "array", "items": INDUSTRY_INSIGHT_SCHEMA})
+validate_level_details = fastjsonschema.compile(LEVEL_DETAILS_SCHEMA)
+
+# Per-item validators for responses that are parsed as a stream
+validate_roadmap_level = fastjsonschema.compile(ROADMAP_LEVEL_SCHEMA)
+validate_skill = fastjsonschema.compile(SKILL_SCHEMA)
+validate_course = fastjsonschema.compile(COURSE_SCHEMA)
+validate_project = fastjsonschema.compile(PROJECT_SCHEMA)
+validate_role = fastjsonschema.compile(ROLE_SCHEMA)
+validate_industry_insight = fastjsonschema.compile(INDUSTRY_INSIGHT_SCHEMA)
+
+# Responses memoized by URL; the reference data doesn't change within a run
+_response_cache = {}
+
+# ETags and bodies persisted across runs so unchanged responses come back as 304s
+ETAG_CACHE_PATH = Path(__file__).parent / ".cache" / "etags.json"
+
+def load_etag_cache():
+    try:
+        return orjson.loads(ETAG_CACHE_PATH.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def save_etag_cache():
+    # Merge with what other xdist workers may have written since we loaded the file
+    merged = {**load_etag_cache(), **_etag_cache}
+    ETAG_CACHE_PATH.parent.mkdir(exist_ok=True)
+    tmp_path = ETAG_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(merged))
+    os.replace(tmp_path, ETAG_CACHE_PATH)
+
+_etag_cache = load_etag_cache()
+
+async def cached_get(client, path, **params):
+    """GET a path once per run and return its (status_code, raw body)"""
+    key = f"{path}?{urlencode(params)}" if params else path
+    if key in _response_cache:
+        return _response_cache[key]
+
+    stored = _etag_cache.get(key)
+    headers = {"If-None-Match": stored["etag"]} if stored else None
+    async with client.get(path, params=params, headers=headers) as response:
+        if response.status == 304:
+            _response_cache[key] = (200, stored["body"].encode())
+        else:
+            body = await response.read()
+            _response_cache[key] = (response.status, body)
+            if response.status == 200 and "ETag" in response.headers:
+                _etag_cache[key] = {"etag": response.headers["ETag"], "body": body.decode()}
+                save_etag_cache()
+    return _response_cache[key]
+
+async def stream_validate(client, path, validate):
+    """Validate each item of a JSON list response as it arrives and return the item count"""
+    count = 0
+    async with client.get(path) as response:
+        assert response.status == 200
+        # The response's StreamReader is already the async file-like object ijson reads from
+        async for item in ijson.items(response.content, "item"):
+            validate(item)
+            count += 1
+    return count
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bundle(client):
+    """All reference data fetched in one request and shared by every test"""
+    status, body = await cached_get(client, PATHS["bundle"])
+    assert status == 200
+    return orjson.loads(body)
+
+@pytest.fixture(scope="session")
+def roadmap(bundle):
+    """Roadmap levels from the bundle"""
+    return bundle["roadmap"]
+
+# (path name, item validator, seeded item count) for the individual list endpoint smoke checks
+LIST_ENDPOINTS = [
+    ("skills", validate_skill, 10),
+    ("courses", validate_course, 8),
+    ("projects", validate_project, 4),
+    ("roles", validate_role, 4),
+    ("insights", validate_industry_insight, 3),
+    ("roadmap", validate_roadmap_level, 4)
+]
+
+@pytest.mark.parametrize("name, validate, expected_count", LIST_ENDPOINTS, ids=[name for name, _, _ in LIST_ENDPOINTS])
+async def test_00_list_endpoint_smoke(client, name, validate, expected_count):
+    """Smoke test that an individual list endpoint responds with valid items"""
+    print(f"\n🔍 Testing {PATHS[name]} endpoint...")
+    count = await stream_validate(client, PATHS[name], validate)
+    # Exact, so duplicated documents or seed drift fail the smoke test
+    assert count == expected_count
+    print(f"✅ {PATHS[name]} endpoint smoke test passed - Found {count} items")
+
+async def test_01_root_endpoint(client):
+    """Test the root API endpoint"""
+    print("\n🔍 Testing root API endpoint...")
+    async with client.get(PATHS["root"]) as response:
+        assert response.status == 200
+        data = await response.json(loads=orjson.loads)
+    assert data["message"] == "IoT Career Roadmap API"
+    print("✅ Root API endpoint test passed")
+
+async def test_02_get_roadmap(client, roadmap):
+    """Test the roadmap endpoint"""
+    print("\n🔍 Testing roadmap endpoint...")
+    status, body = await cached_get(client, PATHS["roadmap"])
+    assert status == 200
+    data = orjson.loads(body)
+    assert isinstance(data, list)
+    assert data == roadmap  # The bundle must carry the same roadmap the frontend reads
+    assert len(data) == 4  # Should have 4 roadmap levels
+
+    # Verify roadmap level structure
+    validate_roadmap_level_list(data)
+
+    # Verify level ordering
+    assert data[0]["level_number"] == 1
+    assert data[1]["level_number"] == 2
+    assert data[2]["level_number"] == 3
+    assert data[3]["level_number"] == 4
+    print(f"✅ Roadmap endpoint test passed - Found {len(data)} levels")
+
+async def test_03_get_level_details(client, roadmap):
+    """Test the level details endpoint"""
+    print("\n🔍 Testing level details endpoint...")
+    level_id = roadmap[0]["id"]
+
+    async with client.get(f"{PATHS['roadmap']}/level/{level_id}") as response:
+        assert response.status == 200
+        data = await response.json(loads=orjson.loads)
+
+    # Verify level details structure
+    validate_level_details(data)
+
+    # Verify data relationships
+    level = data["level"]
+    skills = data["skills"]
+    courses = data["courses"]
+    projects = data["projects"]
+    roles = data["roles"]
+
+    # Check that skills in level match skills array
+    skill_ids = {skill["id"] for skill in skills}
+    missing_skills = set(level["skills_to_develop"]) - skill_ids
+    assert not missing_skills, f"Skills missing from level details: {missing_skills}"
+
+    # Check that courses in level match courses array
+    course_ids = {course["id"] for course in courses}
+    missing_courses = set(level["recommended_courses"]) - course_ids
+    assert not missing_courses, f"Courses missing from level details: {missing_courses}"
+
+    print(f"✅ Level details endpoint test passed - Found {len(skills)} skills, {len(courses)} courses, {len(projects)} projects, {len(roles)} roles")
+
+# (path name, bundle key, list validator, minimum count, query param, filter value, filtered field)
+FILTERED_ENDPOINTS = [
+    ("skills", "skills", validate_skill_list, 10, "difficulty", "beginner", "difficulty_level"),
+    ("courses", "courses", validate_course_list, 8, "difficulty", "advanced", "difficulty_level"),
+    ("projects", "projects", validate_project_list, 4, "difficulty", "expert", "difficulty_level"),
+    ("roles", "roles", validate_role_list, 4, "level", "intermediate", "level"),
+    ("insights", "industry_insights", validate_industry_insight_list, 3,
+     "specialization", "industrial_iot", "specialization")
+]
+
+@pytest.mark.parametrize(
+    "name, bundle_key, validate_list, min_count, param, value, field",
+    FILTERED_ENDPOINTS,
+    ids=[name for name, *_ in FILTERED_ENDPOINTS]
+)
+async def test_04_filtered_list_endpoint(
+    client, bundle, name, bundle_key, validate_list, min_count, param, value, field
+):
+    """Test a list endpoint's contents and its query filter"""
+    print(f"\n🔍 Testing {PATHS[name]} endpoint...")
+    data = bundle[bundle_key]
+    assert isinstance(data, list)
+    assert len(data) >= min_count
+
+    # Verify item structure
+    validate_list(data)
+
+    # Test filtering
+    status, body = await cached_get(client, PATHS[name], **{param: value})
+    assert status == 200
+    filtered = orjson.loads(body)
+    assert isinstance(filtered, list)
+    for item in filtered:
+        assert item[field] == value
+
+    print(f"✅ {PATHS[name]} endpoint test passed - Found {len(data)} items, {len(filtered)} with {param}={value}")
+
+async def test_05_compressed_transfer(client):
+    """Test that large JSON payloads are sent compressed"""
+    print("\n🔍 Testing response compression...")
+    async with client.get(PATHS["bundle"]) as response:
+        assert response.status == 200
+        assert response.headers.get("Content-Encoding", "") in ("gzip", "br")
+    print(f"✅ Compression test passed - Content-Encoding: {response.headers['Content-Encoding']}")
+
+async def test_06_conditional_get(client):
+    """Test that revalidating with a response's ETag returns 304 without a body"""
+    print("\n🔍 Testing conditional GET...")
+    async with client.get(PATHS["skills"]) as response:
+        assert response.status == 200
+        etag = response.headers["ETag"]
+        await response.read()
+
+    async with client.get(PATHS["skills"], headers={"If-None-Match": etag}) as response:
+        assert response.status == 304
+        assert await response.read() == b""
+    print(f"✅ Conditional GET test passed - ETag: {etag}")
 
 if __name__ == "__main__":
     print("🧪 Starting IoT Career Roadmap API Tests...")
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    # Every test is a read-only GET, so they run in parallel across xdist workers
+    exit_code = pytest.main([__file__, "-v", "-n", "4"])
     print("\n🏁 All API tests completed!")
+    sys.exit(exit_code)
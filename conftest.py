@@ -0,0 +1,30 @@
+import aiohttp
+import pytest_asyncio
+import uvloop
+
+# Use the public endpoint from frontend/.env
+BACKEND_URL = "https://d369f806-187f-4f1d-afc8-a5a03877c618.preview.emergentagent.com"
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop instead of the default selector loop"""
+    return {"uvloop": uvloop.new_event_loop}
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(worker_id):
+    """aiohttp session whose pooled connections are shared by every test"""
+    # Under pytest-xdist each worker builds its own session; worker_id is "master" when running serially
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    headers = {
+        "Accept-Encoding": "br, gzip",
+        "Accept": "application/json",
+        "User-Agent": f"iot-roadmap-tests/{worker_id}"
+    }
+    timeout = aiohttp.ClientTimeout(total=10.0)
+    async with aiohttp.ClientSession(
+        base_url=BACKEND_URL, connector=connector, headers=headers, timeout=timeout
+    ) as c:
+        # Pay for DNS, TCP and TLS once here so the first test starts on a warm pooled connection;
+        # only the handshake matters, so the status of the probe is ignored
+        async with c.head("/", timeout=aiohttp.ClientTimeout(total=5.0)):
+            pass
+        yield c